@@ -6,6 +6,8 @@ header injection, retries, and error mapping.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import time
 from typing import Any, Dict, Optional
@@ -24,9 +26,20 @@ from protol.exceptions import (
 
 logger = logging.getLogger("protol")
 
+# Indirection over the backoff sleeps so tests can stub them out without
+# touching the global time/asyncio modules.
+_sleep = time.sleep
+_async_sleep = asyncio.sleep
 
+
+@functools.lru_cache(maxsize=32)
 def _build_headers(api_key: str) -> dict[str, str]:
-    """Build default request headers."""
+    """Build default request headers.
+
+    Memoized per api_key: the headers never change for a given key and httpx
+    copies them into its own Headers object, so the cached dict is shared
+    safely across clients.
+    """
     return {
         "Authorization": f"Bearer {api_key}",
         "User-Agent": f"protol-py/{SDK_VERSION}",
@@ -128,7 +141,7 @@ class HttpClient:
                             path,
                             wait,
                         )
-                        time.sleep(wait)
+                        _sleep(wait)
                         continue
 
                 _handle_error_response(response)
@@ -151,7 +164,7 @@ class HttpClient:
                         path,
                         wait,
                     )
-                    time.sleep(wait)
+                    _sleep(wait)
                     continue
                 raise NetworkError(
                     message=f"Failed to connect after {self._max_retries + 1} attempts: {exc}"
@@ -166,7 +179,7 @@ class HttpClient:
                         path,
                         wait,
                     )
-                    time.sleep(wait)
+                    _sleep(wait)
                     continue
                 raise NetworkError(
                     message=f"Request timed out after {self._max_retries + 1} attempts: {exc}"
@@ -231,8 +244,6 @@ class AsyncHttpClient:
         params: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """Execute an async HTTP request with retries and error handling."""
-        import asyncio
-
         last_exception: Optional[Exception] = None
 
         for attempt in range(self._max_retries + 1):
@@ -272,7 +283,7 @@ class AsyncHttpClient:
                             path,
                             wait,
                         )
-                        await asyncio.sleep(wait)
+                        await _async_sleep(wait)
                         continue
 
                 _handle_error_response(response)
@@ -295,7 +306,7 @@ class AsyncHttpClient:
                         path,
                         wait,
                     )
-                    await asyncio.sleep(wait)
+                    await _async_sleep(wait)
                     continue
                 raise NetworkError(
                     message=f"Failed to connect after {self._max_retries + 1} attempts: {exc}"
@@ -310,7 +321,7 @@ class AsyncHttpClient:
                         path,
                         wait,
                     )
-                    await asyncio.sleep(wait)
+                    await _async_sleep(wait)
                     continue
                 raise NetworkError(
                     message=f"Request timed out after {self._max_retries + 1} attempts: {exc}"
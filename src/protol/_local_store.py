@@ -75,6 +75,15 @@ class LocalStore:
         """No-op for local store."""
         pass
 
+    def _reset(self) -> None:
+        """Clear all stored agents, actions, and incidents.
+
+        Intended for reuse of a single store across test cases.
+        """
+        self._agents.clear()
+        self._actions.clear()
+        self._incidents.clear()
+
     # ------------------------------------------------------------------
     # Router
     # ------------------------------------------------------------------
@@ -216,13 +225,37 @@ class LocalStore:
     def _list_agents(self) -> List[Dict[str, Any]]:
         return list(self._agents.values())
 
+    def record_actions_bulk(
+        self, agent_id: str, records: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Record many action payloads in one pass.
+
+        Appends all records and recomputes reputation once, instead of once
+        per action. Used by Agent._bulk_log_actions for local-mode seeding.
+        """
+        self._get_agent(agent_id)
+        now = _now_iso()
+        actions = [self._build_action(agent_id, data, now) for data in records]
+        self._actions[agent_id].extend(actions)
+        self._recompute_reputation(agent_id)
+        return actions
+
     def _record_action(self, agent_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         self._get_agent(agent_id)  # Ensure agent exists
-        action_id = _random_id("act_")
-        now = _now_iso()
+        action = self._build_action(agent_id, data, _now_iso())
+        self._actions[agent_id].append(action)
 
+        # Recompute reputation and stats
+        self._recompute_reputation(agent_id)
+
+        return action
+
+    def _build_action(
+        self, agent_id: str, data: Dict[str, Any], now: str
+    ) -> Dict[str, Any]:
+        """Build a stored action dict from a request payload."""
         action: Dict[str, Any] = {
-            "action_id": action_id,
+            "action_id": _random_id("act_"),
             "agent_id": agent_id,
             "action_type": data.get("action_type", "task_execution"),
             "task_category": data.get("task_category"),
@@ -248,12 +281,6 @@ class LocalStore:
             "input_size_bytes": data.get("input_size_bytes"),
             "output_size_bytes": data.get("output_size_bytes"),
         }
-
-        self._actions[agent_id].append(action)
-
-        # Recompute reputation and stats
-        self._recompute_reputation(agent_id)
-
         return action
 
     def _get_actions(
@@ -7,6 +7,10 @@ import json
 import re
 from typing import Any
 
+# Precompiled ID/key format patterns.
+_AGENT_ID_RE = re.compile(r"^agt_[a-zA-Z0-9]{6,12}$")
+_API_KEY_RE = re.compile(r"^aos_sk_.{20,}$")
+
 
 def hash_data(data: Any) -> str:
     """Create a SHA-256 hash of any data.
@@ -53,7 +57,7 @@ def validate_agent_id(agent_id: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    return bool(re.match(r"^agt_[a-zA-Z0-9]{6,12}$", agent_id))
+    return bool(_AGENT_ID_RE.match(agent_id))
 
 
 def validate_api_key(api_key: str) -> bool:
@@ -65,7 +69,7 @@ def validate_api_key(api_key: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    return bool(re.match(r"^aos_sk_.{20,}$", api_key))
+    return bool(_API_KEY_RE.match(api_key))
 
 
 def calculate_size_bytes(data: Any) -> int:
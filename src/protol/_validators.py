@@ -0,0 +1,39 @@
+"""Internal field-validation helpers for the Protol SDK models.
+
+NOT part of the public API. The closed-vocabulary fields are enforced by the
+Literal types in protol.constants; only the checks that need real logic
+(format and length rules) live here as plain module-level functions.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+# Precompiled patterns for the string-format checks.
+_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9\-_ ]*$")
+_URL_RE = re.compile(r"^https?://")
+
+
+def check_name(v: str) -> str:
+    if not _NAME_RE.match(v):
+        raise ValueError(
+            "Name must start with alphanumeric and contain only "
+            "alphanumeric characters, hyphens, underscores, or spaces."
+        )
+    return v
+
+
+def check_capabilities(v: list[str]) -> list[str]:
+    bad = next((cap for cap in v if not 2 <= len(cap) <= 50), None)
+    if bad is not None:
+        raise ValueError(
+            f"Each capability must be 2-50 characters. Got '{bad}' ({len(bad)} chars)."
+        )
+    return v
+
+
+def check_source_url(v: Optional[str]) -> Optional[str]:
+    if v is not None and not _URL_RE.match(v):
+        raise ValueError("source_url must be a valid HTTP/HTTPS URL.")
+    return v
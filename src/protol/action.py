@@ -11,12 +11,18 @@ import threading
 from datetime import datetime, timezone
 from typing import Any, Optional, Union
 
+from pydantic import TypeAdapter
+
 from protol._utils import calculate_size_bytes, hash_data
+from protol.constants import ActionType, CommissionerType, Environment, ErrorType
 from protol.exceptions import ActionError
-from protol.models import ActionRecord, ActionResponse
+from protol.models import ActionRating, ActionRecord, ActionResponse
 
 logger = logging.getLogger("protol")
 
+# Cached adapter so rate() validates without building a throwaway model.
+_RATING_ADAPTER: TypeAdapter[ActionRating] = TypeAdapter(ActionRating)
+
 
 class Action:
     """Context manager for logging agent actions.
@@ -44,12 +50,12 @@ class Action:
         self,
         client: Any,
         agent_id: str,
-        action_type: str = "task_execution",
+        action_type: ActionType = "task_execution",
         task_category: Optional[str] = None,
         commissioned_by: Optional[str] = None,
-        commissioner_type: Optional[str] = None,
+        commissioner_type: Optional[CommissionerType] = None,
         description: Optional[str] = None,
-        environment: str = "production",
+        environment: Environment = "production",
     ) -> None:
         self._client = client
         self._agent_id = agent_id
@@ -182,7 +188,7 @@ class Action:
 
     def fail(
         self,
-        error_type: str = "unknown",
+        error_type: ErrorType = "unknown",
         error_message: Optional[str] = None,
         cost_usd: Optional[float] = None,
     ) -> ActionResponse:
@@ -257,9 +263,7 @@ class Action:
                 message="Cannot rate an action that hasn't been recorded yet."
             )
 
-        from protol.models import ActionRating
-
-        ActionRating(rating=rating, feedback=feedback)  # Validate
+        _RATING_ADAPTER.validate_python({"rating": rating, "feedback": feedback})
 
         data = self._client.patch(
             f"/agents/{self._agent_id}/actions/{self._action_response.action_id}",
@@ -349,12 +353,13 @@ class Action:
                     f"/agents/{self._agent_id}/actions", json=payload
                 )
                 self._action_response = ActionResponse.model_validate(data)
-                logger.info(
-                    "Action %s recorded for agent %s [%s]",
-                    self._action_response.action_id,
-                    self._agent_id,
-                    kwargs.get("status", "success"),
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Action %s recorded for agent %s [%s]",
+                        self._action_response.action_id,
+                        self._agent_id,
+                        kwargs.get("status", "success"),
+                    )
                 return self._action_response
         except ImportError:
             pass
@@ -387,12 +392,13 @@ class Action:
                 self._action_response = ActionResponse.model_validate(
                     result_holder["data"]
                 )
-                logger.info(
-                    "Action %s recorded for agent %s [%s]",
-                    self._action_response.action_id,
-                    self._agent_id,
-                    kwargs.get("status", "success"),
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Action %s recorded for agent %s [%s]",
+                        self._action_response.action_id,
+                        self._agent_id,
+                        kwargs.get("status", "success"),
+                    )
                 return self._action_response
             elif "error" in result_holder:
                 logger.warning(
@@ -482,12 +488,13 @@ class Action:
                 )
 
             self._action_response = ActionResponse.model_validate(data)
-            logger.info(
-                "Action %s recorded for agent %s [%s]",
-                self._action_response.action_id,
-                self._agent_id,
-                kwargs.get("status", "success"),
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Action %s recorded for agent %s [%s]",
+                    self._action_response.action_id,
+                    self._agent_id,
+                    kwargs.get("status", "success"),
+                )
             return self._action_response
         except Exception as exc:
             logger.error(
@@ -536,7 +543,7 @@ class Action:
 
     async def async_fail(
         self,
-        error_type: str = "unknown",
+        error_type: ErrorType = "unknown",
         error_message: Optional[str] = None,
         cost_usd: Optional[float] = None,
     ) -> ActionResponse:
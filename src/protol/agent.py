@@ -10,6 +10,13 @@ from datetime import datetime, timezone
 from typing import Any, Optional, Union
 
 from protol.action import Action
+from protol.constants import (
+    ActionStatus,
+    ActionType,
+    CommissionerType,
+    Environment,
+    ErrorType,
+)
 from protol.models import (
     ActionRecord,
     ActionResponse,
@@ -33,7 +40,7 @@ class Agent:
         self,
         client: Any,
         profile: AgentProfile,
-        default_environment: str = "production",
+        default_environment: Environment = "production",
     ) -> None:
         self._client = client
         self._profile = profile
@@ -94,12 +101,12 @@ class Agent:
 
     def action(
         self,
-        action_type: str = "task_execution",
+        action_type: ActionType = "task_execution",
         task_category: Optional[str] = None,
         commissioned_by: Optional[str] = None,
-        commissioner_type: Optional[str] = None,
+        commissioner_type: Optional[CommissionerType] = None,
         description: Optional[str] = None,
-        environment: Optional[str] = None,
+        environment: Optional[Environment] = None,
     ) -> Action:
         """Create an action context manager for logging.
 
@@ -133,12 +140,12 @@ class Agent:
 
     def log_action(
         self,
-        action_type: str,
-        status: str,
+        action_type: ActionType,
+        status: ActionStatus,
         task_category: Optional[str] = None,
         description: Optional[str] = None,
         commissioned_by: Optional[str] = None,
-        commissioner_type: Optional[str] = None,
+        commissioner_type: Optional[CommissionerType] = None,
         started_at: Optional[datetime] = None,
         completed_at: Optional[datetime] = None,
         duration_ms: Optional[int] = None,
@@ -149,9 +156,9 @@ class Agent:
         cost_usd: Optional[float] = None,
         payment_usd: Optional[float] = None,
         self_reported_confidence: Optional[float] = None,
-        error_type: Optional[str] = None,
+        error_type: Optional[ErrorType] = None,
         error_message: Optional[str] = None,
-        environment: Optional[str] = None,
+        environment: Optional[Environment] = None,
     ) -> ActionResponse:
         """Manually log a completed action without using the context manager.
 
@@ -188,6 +195,21 @@ class Agent:
         data = self._client.post(f"/agents/{self.id}/actions", json=payload)
         return ActionResponse.model_validate(data)
 
+    def _bulk_log_actions(self, records: list[dict[str, Any]]) -> None:
+        """Record many pre-built action payloads at once.
+
+        Internal helper for bulk seeding: in local mode the store appends all
+        records and recomputes reputation once. Falls back to sequential
+        posts for HTTP clients, which have no bulk endpoint.
+        """
+        from protol._local_store import LocalStore
+
+        if isinstance(self._client, LocalStore):
+            self._client.record_actions_bulk(self.id, records)
+        else:
+            for record in records:
+                self._client.post(f"/agents/{self.id}/actions", json=record)
+
     def get_actions(
         self,
         limit: int = 50,
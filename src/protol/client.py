@@ -8,12 +8,20 @@ from __future__ import annotations
 import logging
 from typing import Any, Optional, Union
 
+from pydantic import TypeAdapter
+
 from protol._utils import validate_api_key
 from protol.agent import Agent
 from protol.constants import (
     DEFAULT_BASE_URL,
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
+    VALID_AGENT_CATEGORIES,
+    AgentCategory,
+    AutonomyLevel,
+    Environment,
+    IncidentType,
+    SeverityLevel,
 )
 from protol.exceptions import ValidationError
 from protol.models import (
@@ -25,10 +33,17 @@ from protol.models import (
     IncidentResponse,
     LeaderboardEntry,
     SearchResult,
+    _parse_search_result,
 )
 
 logger = logging.getLogger("protol")
 
+# Cached adapter so register_agents validates a whole spec list in one
+# pydantic-core pass.
+_REGISTRATION_LIST_ADAPTER: TypeAdapter[list[AgentRegistration]] = TypeAdapter(
+    list[AgentRegistration]
+)
+
 
 class Protol:
     """Main client for the Protol platform.
@@ -64,7 +79,7 @@ class Protol:
         base_url: str = DEFAULT_BASE_URL,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        environment: str = "production",
+        environment: Environment = "production",
         local_mode: bool = False,
     ) -> None:
         self._api_key = api_key
@@ -95,14 +110,14 @@ class Protol:
     def register_agent(
         self,
         name: str,
-        category: str,
+        category: AgentCategory,
         capabilities: list[str],
         model_provider: Optional[str] = None,
         model_name: Optional[str] = None,
         framework: Optional[str] = None,
         hosting: Optional[str] = None,
         source_url: Optional[str] = None,
-        autonomy_level: str = "semi",
+        autonomy_level: AutonomyLevel = "semi",
         max_spend_per_task: Optional[float] = None,
         can_hire_agents: bool = False,
         description: Optional[str] = None,
@@ -143,6 +158,71 @@ class Protol:
             default_environment=self._environment,
         )
 
+    def register_agents(self, specs: list[dict[str, Any]]) -> list[Agent]:
+        """Register several agents at once.
+
+        Validates the whole spec list in a single pass, then registers each
+        agent. Specs take the same fields as ``register_agent``.
+
+        Args:
+            specs: List of registration dicts.
+
+        Returns:
+            List of Agent instances, in input order.
+
+        Raises:
+            ValidationError: If any spec is invalid (nothing is registered).
+        """
+        validated = _REGISTRATION_LIST_ADAPTER.validate_python(specs)
+
+        agents = []
+        for registration in validated:
+            payload = registration.model_dump(mode="json", exclude_none=True)
+            data = self._client.post("/agents", json=payload)
+            profile = AgentProfile.model_validate(data)
+            agents.append(
+                Agent(
+                    client=self._client,
+                    profile=profile,
+                    default_environment=self._environment,
+                )
+            )
+
+        logger.info("Registered %d agents in bulk.", len(agents))
+        return agents
+
+    def _register_trusted(
+        self,
+        name: str,
+        category: str,
+        capabilities: list[str],
+        **extra: Any,
+    ) -> Agent:
+        """Register an agent without request-side validation.
+
+        Internal fast path for callers whose input is already known-good
+        (e.g. the SDK's own test seeding): skips building an
+        AgentRegistration model and posts the payload directly. A cheap
+        category check guards against silent typos.
+        """
+        if category not in VALID_AGENT_CATEGORIES:
+            raise ValidationError(message=f"Invalid category '{category}'.")
+
+        payload: dict[str, Any] = {
+            "name": name,
+            "category": category,
+            "capabilities": capabilities,
+        }
+        payload.update({k: v for k, v in extra.items() if v is not None})
+
+        data = self._client.post("/agents", json=payload)
+        profile = AgentProfile.model_validate(data)
+        return Agent(
+            client=self._client,
+            profile=profile,
+            default_environment=self._environment,
+        )
+
     def get_agent(self, agent_id: str) -> Agent:
         """Connect to an existing registered agent.
 
@@ -235,7 +315,7 @@ class Protol:
             params["model_provider"] = model_provider
 
         data = self._client.get("/agents/search", params=params)
-        return SearchResult.model_validate(data)
+        return _parse_search_result(data)
 
     def get_leaderboard(
         self,
@@ -272,8 +352,8 @@ class Protol:
     def report_incident(
         self,
         agent_id: str,
-        incident_type: str,
-        severity: str,
+        incident_type: IncidentType,
+        severity: SeverityLevel,
         title: str,
         description: str,
         evidence_url: Optional[str] = None,
@@ -345,7 +425,7 @@ class AsyncProtol:
         base_url: str = DEFAULT_BASE_URL,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        environment: str = "production",
+        environment: Environment = "production",
         local_mode: bool = False,
     ) -> None:
         self._api_key = api_key
@@ -375,14 +455,14 @@ class AsyncProtol:
     async def register_agent(
         self,
         name: str,
-        category: str,
+        category: AgentCategory,
         capabilities: list[str],
         model_provider: Optional[str] = None,
         model_name: Optional[str] = None,
         framework: Optional[str] = None,
         hosting: Optional[str] = None,
         source_url: Optional[str] = None,
-        autonomy_level: str = "semi",
+        autonomy_level: AutonomyLevel = "semi",
         max_spend_per_task: Optional[float] = None,
         can_hire_agents: bool = False,
         description: Optional[str] = None,
@@ -419,6 +499,35 @@ class AsyncProtol:
             default_environment=self._environment,
         )
 
+    async def register_agents(self, specs: list[dict[str, Any]]) -> list[Agent]:
+        """Register several agents at once (async).
+
+        Validates the whole spec list in a single pass, then registers each
+        agent. Specs take the same fields as ``register_agent``.
+        """
+        validated = _REGISTRATION_LIST_ADAPTER.validate_python(specs)
+
+        agents = []
+        for registration in validated:
+            payload = registration.model_dump(mode="json", exclude_none=True)
+
+            if self._local_mode:
+                data = self._client.post("/agents", json=payload)
+            else:
+                data = await self._client.post("/agents", json=payload)
+
+            profile = AgentProfile.model_validate(data)
+            agents.append(
+                Agent(
+                    client=self._client,
+                    profile=profile,
+                    default_environment=self._environment,
+                )
+            )
+
+        logger.info("Registered %d agents in bulk.", len(agents))
+        return agents
+
     async def get_agent(self, agent_id: str) -> Agent:
         """Connect to an existing agent (async)."""
         if self._local_mode:
@@ -487,7 +596,7 @@ class AsyncProtol:
         else:
             data = await self._client.get("/agents/search", params=params)
 
-        return SearchResult.model_validate(data)
+        return _parse_search_result(data)
 
     async def get_leaderboard(
         self,
@@ -520,8 +629,8 @@ class AsyncProtol:
     async def report_incident(
         self,
         agent_id: str,
-        incident_type: str,
-        severity: str,
+        incident_type: IncidentType,
+        severity: SeverityLevel,
         title: str,
         description: str,
         evidence_url: Optional[str] = None,
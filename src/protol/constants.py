@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Literal, get_args
+
 SDK_VERSION: str = "0.1.0"
 DEFAULT_BASE_URL: str = "https://api.protol.dev/v1"
 DEFAULT_TIMEOUT: int = 30  # seconds
 DEFAULT_MAX_RETRIES: int = 3
 
-VALID_AGENT_CATEGORIES: list[str] = [
+# Closed vocabularies as Literal types: pydantic validates these in Rust via
+# its literal fast path. The VALID_* frozensets are derived for runtime checks.
+AgentCategory = Literal[
     "research",
     "coding",
     "writing",
@@ -24,9 +28,9 @@ VALID_AGENT_CATEGORIES: list[str] = [
     "general",
 ]
 
-VALID_AUTONOMY_LEVELS: list[str] = ["assisted", "semi", "autonomous"]
+AutonomyLevel = Literal["assisted", "semi", "autonomous"]
 
-VALID_ACTION_TYPES: list[str] = [
+ActionType = Literal[
     "task_execution",
     "agent_hire",
     "api_call",
@@ -35,7 +39,7 @@ VALID_ACTION_TYPES: list[str] = [
     "decision",
 ]
 
-VALID_ACTION_STATUSES: list[str] = [
+ActionStatus = Literal[
     "running",
     "success",
     "partial",
@@ -44,7 +48,7 @@ VALID_ACTION_STATUSES: list[str] = [
     "error",
 ]
 
-VALID_ERROR_TYPES: list[str] = [
+ErrorType = Literal[
     "timeout",
     "hallucination",
     "api_failure",
@@ -56,7 +60,7 @@ VALID_ERROR_TYPES: list[str] = [
     "unknown",
 ]
 
-VALID_INCIDENT_TYPES: list[str] = [
+IncidentType = Literal[
     "data_leak",
     "hallucination",
     "unauthorized_action",
@@ -67,8 +71,28 @@ VALID_INCIDENT_TYPES: list[str] = [
     "performance_degradation",
 ]
 
-VALID_SEVERITY_LEVELS: list[str] = ["low", "medium", "high", "critical"]
+SeverityLevel = Literal["low", "medium", "high", "critical"]
+
+Environment = Literal["production", "staging", "development", "test"]
+
+CommissionerType = Literal["agent", "human"]
+
+VALID_AGENT_CATEGORIES: frozenset[str] = frozenset(get_args(AgentCategory))
+
+VALID_AUTONOMY_LEVELS: frozenset[str] = frozenset(get_args(AutonomyLevel))
+
+VALID_ACTION_TYPES: frozenset[str] = frozenset(get_args(ActionType))
+
+VALID_ACTION_STATUSES: frozenset[str] = frozenset(get_args(ActionStatus))
+
+VALID_ERROR_TYPES: frozenset[str] = frozenset(get_args(ErrorType))
+
+VALID_INCIDENT_TYPES: frozenset[str] = frozenset(get_args(IncidentType))
+
+VALID_SEVERITY_LEVELS: frozenset[str] = frozenset(get_args(SeverityLevel))
 
-VALID_ENVIRONMENTS: list[str] = ["production", "staging", "development", "test"]
+VALID_ENVIRONMENTS: frozenset[str] = frozenset(get_args(Environment))
 
-VALID_TRUST_TIERS: list[str] = ["Unverified", "Bronze", "Silver", "Gold", "Platinum"]
+VALID_TRUST_TIERS: frozenset[str] = frozenset(
+    {"Unverified", "Bronze", "Silver", "Gold", "Platinum"}
+)
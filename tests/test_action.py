@@ -124,8 +124,7 @@ class TestActionContextManager:
         response = act.response
         assert response is not None
         # Action response from local store shouldn't have raw secret data
-        response_dict = response.model_dump()
-        response_str = str(response_dict)
+        response_str = response.model_dump_json()
         assert "super-secret-value" not in response_str
         assert "sk_12345" not in response_str
 
@@ -4,11 +4,19 @@ from __future__ import annotations
 
 import pytest
 
-from protol.client import Protol, AsyncProtol
+from protol.client import AgentOS, AsyncAgentOS, Protol, AsyncProtol
 from protol.exceptions import ValidationError, NotFoundError
 from protol.models import AgentProfile, EcosystemStats, SearchResult
 
 
+class TestBackwardCompatAliases:
+    def test_aliases_are_same_classes(self):
+        # The AgentOS names are straight aliases, so the Protol suite below
+        # covers them without a duplicated copy of every test class.
+        assert AgentOS is Protol
+        assert AsyncAgentOS is AsyncProtol
+
+
 class TestProtolInit:
     def test_local_mode_accepts_any_key(self):
         p = Protol(api_key="any_key", local_mode=True)
@@ -77,6 +85,29 @@ class TestProtolRegister:
             )
 
 
+class TestProtolRegisterAgents:
+    def test_register_agents_bulk(self, aos_local):
+        agents = aos_local.register_agents(
+            [
+                {"name": f"bulk-{i}", "category": "research", "capabilities": ["test"]}
+                for i in range(3)
+            ]
+        )
+        assert [a.name for a in agents] == ["bulk-0", "bulk-1", "bulk-2"]
+        assert all(a.id.startswith("agt_") for a in agents)
+        assert len(aos_local.list_my_agents()) == 3
+
+    def test_register_agents_invalid_spec_registers_nothing(self, aos_local):
+        specs = [
+            {"name": "bulk-ok", "category": "research", "capabilities": ["test"]},
+            {"name": "bulk-bad", "category": "nonexistent", "capabilities": ["test"]},
+        ]
+        with pytest.raises(Exception):  # ValidationError from Pydantic
+            aos_local.register_agents(specs)
+        # Validation is all-or-nothing: the valid spec must not have landed.
+        assert aos_local.list_my_agents() == []
+
+
 class TestProtolGetAgent:
     def test_get_existing_agent(self, aos_local):
         created = aos_local.register_agent(
@@ -125,19 +156,19 @@ class TestProtolSearch:
 
 class TestProtolLeaderboard:
     def test_leaderboard(self, aos_local):
-        for i in range(3):
-            aos_local.register_agent(
-                name=f"leader-{i}", category="research", capabilities=["test"]
-            )
+        aos_local.register_agents(
+            [
+                {"name": f"leader-{i}", "category": "research", "capabilities": ["test"]}
+                for i in range(3)
+            ]
+        )
         leaders = aos_local.get_leaderboard()
         assert len(leaders) == 3
 
 
 class TestProtolEcosystemStats:
-    def test_ecosystem_stats(self, aos_local):
-        aos_local.register_agent(
-            name="stats-agent", category="research", capabilities=["test"]
-        )
+    def test_ecosystem_stats(self, aos_local, make_agent):
+        make_agent(name="stats-agent")
         stats = aos_local.get_ecosystem_stats()
         assert isinstance(stats, EcosystemStats)
         assert stats.total_agents >= 1
@@ -176,9 +207,9 @@ class TestProtolListMyAgents:
         agents = aos_local.list_my_agents()
         assert agents == []
 
-    def test_list_with_agents(self, aos_local):
-        aos_local.register_agent(name="list-1", category="research", capabilities=["test"])
-        aos_local.register_agent(name="list-2", category="coding", capabilities=["test"])
+    def test_list_with_agents(self, aos_local, make_agent):
+        make_agent(name="list-1")
+        make_agent(name="list-2", category="coding")
         agents = aos_local.list_my_agents()
         assert len(agents) == 2
 
@@ -204,34 +235,49 @@ class TestEnvironmentPropagation:
         p.close()
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestAsyncProtol:
-    @pytest.mark.asyncio
-    async def test_async_local_mode(self):
-        async with AsyncProtol(api_key="test", local_mode=True) as p:
-            agent = await p.register_agent(
-                name="async-agent", category="research", capabilities=["test"]
-            )
-            assert agent.id.startswith("agt_")
+    async def test_async_local_mode(self, async_protol):
+        agent = await async_protol.register_agent(
+            name="async-agent", category="research", capabilities=["test"]
+        )
+        assert agent.id.startswith("agt_")
 
-    @pytest.mark.asyncio
     async def test_async_invalid_key(self):
         with pytest.raises(ValidationError):
             AsyncProtol(api_key="bad_key")
 
-    @pytest.mark.asyncio
-    async def test_async_search(self):
-        async with AsyncProtol(api_key="test", local_mode=True) as p:
-            await p.register_agent(
-                name="async-search", category="coding", capabilities=["python"]
-            )
-            results = await p.search_agents(category="coding")
-            assert isinstance(results, SearchResult)
-
-    @pytest.mark.asyncio
-    async def test_async_ecosystem_stats(self):
-        async with AsyncProtol(api_key="test", local_mode=True) as p:
-            await p.register_agent(
-                name="async-stats", category="general", capabilities=["test"]
-            )
-            stats = await p.get_ecosystem_stats()
-            assert stats.total_agents >= 1
+    async def test_async_register_agents_bulk(self, async_protol):
+        agents = await async_protol.register_agents(
+            [
+                {"name": f"async-bulk-{i}", "category": "coding", "capabilities": ["test"]}
+                for i in range(2)
+            ]
+        )
+        assert [a.name for a in agents] == ["async-bulk-0", "async-bulk-1"]
+        assert len(await async_protol.list_my_agents()) == 2
+
+    async def test_async_register_agents_invalid_spec_registers_nothing(
+        self, async_protol
+    ):
+        specs = [
+            {"name": "async-ok", "category": "coding", "capabilities": ["test"]},
+            {"name": "async-bad", "category": "nonexistent", "capabilities": ["test"]},
+        ]
+        with pytest.raises(Exception):  # ValidationError from Pydantic
+            await async_protol.register_agents(specs)
+        assert await async_protol.list_my_agents() == []
+
+    async def test_async_search(self, async_protol):
+        await async_protol.register_agent(
+            name="async-search", category="coding", capabilities=["python"]
+        )
+        results = await async_protol.search_agents(category="coding")
+        assert isinstance(results, SearchResult)
+
+    async def test_async_ecosystem_stats(self, async_protol):
+        await async_protol.register_agent(
+            name="async-stats", category="general", capabilities=["test"]
+        )
+        stats = await async_protol.get_ecosystem_stats()
+        assert stats.total_agents >= 1
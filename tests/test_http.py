@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import pytest
 import httpx
 
@@ -30,143 +32,112 @@ class TestBuildHeaders:
         headers = _build_headers("test_key")
         assert headers["Content-Type"] == "application/json"
 
+    def test_headers_cached_per_key(self):
+        assert _build_headers("test_key") is _build_headers("test_key")
+        assert _build_headers("test_key") is not _build_headers("other_key")
 
-class TestHandleErrorResponse:
-    def _make_response(self, status_code, json_body=None, headers=None):
-        """Create a mock httpx.Response."""
-        return httpx.Response(
-            status_code=status_code,
-            json=json_body or {"error": {"message": "test error"}},
-            headers=headers or {},
-        )
-
-    def test_401_raises_auth_error(self):
-        response = self._make_response(401)
-        with pytest.raises(AuthenticationError):
-            _handle_error_response(response)
-
-    def test_404_raises_not_found(self):
-        response = self._make_response(404)
-        with pytest.raises(NotFoundError):
-            _handle_error_response(response)
-
-    def test_422_raises_validation_error(self):
-        response = self._make_response(422)
-        with pytest.raises(ValidationError):
-            _handle_error_response(response)
-
-    def test_429_raises_rate_limit_error(self):
-        response = self._make_response(
-            429,
-            headers={"Retry-After": "30"},
-        )
-        with pytest.raises(RateLimitError) as exc_info:
-            _handle_error_response(response)
-        assert exc_info.value.retry_after_seconds == 30.0
 
-    def test_429_without_retry_after(self):
-        response = self._make_response(429)
-        with pytest.raises(RateLimitError) as exc_info:
-            _handle_error_response(response)
-        assert exc_info.value.retry_after_seconds is None
+@functools.lru_cache(maxsize=None)
+def _make_error_response(status_code, headers=()):
+    """Create (and cache) an httpx.Response for the given status/headers."""
+    return httpx.Response(
+        status_code=status_code,
+        json={"error": {"message": "test error"}},
+        headers=dict(headers),
+    )
 
-    def test_500_raises_server_error(self):
-        response = self._make_response(500)
-        with pytest.raises(ServerError) as exc_info:
-            _handle_error_response(response)
-        assert exc_info.value.status_code == 500
 
-    def test_503_raises_server_error(self):
-        response = self._make_response(503)
-        with pytest.raises(ServerError) as exc_info:
+class TestHandleErrorResponse:
+    @pytest.mark.parametrize(
+        "status, headers, exc, attr, expected",
+        [
+            (401, (), AuthenticationError, None, None),
+            (404, (), NotFoundError, None, None),
+            (422, (), ValidationError, None, None),
+            (429, (("Retry-After", "30"),), RateLimitError, "retry_after_seconds", 30.0),
+            (429, (), RateLimitError, "retry_after_seconds", None),
+            (500, (), ServerError, "status_code", 500),
+            (503, (), ServerError, "status_code", 503),
+        ],
+    )
+    def test_maps_status_to_exception(self, status, headers, exc, attr, expected):
+        response = _make_error_response(status, headers)
+        with pytest.raises(exc) as exc_info:
             _handle_error_response(response)
-        assert exc_info.value.status_code == 503
+        if attr is not None:
+            assert getattr(exc_info.value, attr) == expected
 
 
 class TestHttpClient:
-    def test_initialization(self):
-        client = HttpClient(
-            api_key="test_key",
-            base_url="https://test.example.com/v1",
-            timeout=10,
-            max_retries=2,
-        )
-        assert client._base_url == "https://test.example.com/v1"
-        assert client._max_retries == 2
-        client.close()
-
-    def test_get_success(self, httpx_mock):
-        httpx_mock.add_response(
-            url="https://test.example.com/v1/test",
-            json={"result": "ok"},
-        )
-        client = HttpClient(
-            api_key="test_key",
-            base_url="https://test.example.com/v1",
-            max_retries=0,
-        )
-        result = client.get("/test")
-        assert result == {"result": "ok"}
-        client.close()
-
-    def test_post_success(self, httpx_mock):
-        httpx_mock.add_response(
-            url="https://test.example.com/v1/test",
-            json={"id": "123"},
-        )
-        client = HttpClient(
-            api_key="test_key",
-            base_url="https://test.example.com/v1",
-            max_retries=0,
-        )
-        result = client.post("/test", json={"name": "test"})
-        assert result == {"id": "123"}
-        client.close()
-
-    def test_401_raises_auth_error(self, httpx_mock):
-        httpx_mock.add_response(
-            url="https://test.example.com/v1/test",
-            status_code=401,
-            json={"error": {"message": "Unauthorized"}},
-        )
+    @pytest.fixture
+    def http_client(self):
+        """Non-retrying client shared by the request tests."""
         client = HttpClient(
             api_key="test_key",
             base_url="https://test.example.com/v1",
             max_retries=0,
         )
-        with pytest.raises(AuthenticationError):
-            client.get("/test")
+        yield client
         client.close()
 
-    def test_404_raises_not_found(self, httpx_mock):
-        httpx_mock.add_response(
-            url="https://test.example.com/v1/agents/agt_notfound",
-            status_code=404,
-            json={"error": {"message": "Not found"}},
-        )
+    def test_initialization(self):
         client = HttpClient(
             api_key="test_key",
             base_url="https://test.example.com/v1",
-            max_retries=0,
+            timeout=10,
+            max_retries=2,
         )
-        with pytest.raises(NotFoundError):
-            client.get("/agents/agt_notfound")
+        assert client._base_url == "https://test.example.com/v1"
+        assert client._max_retries == 2
         client.close()
 
-    def test_retry_on_500(self, httpx_mock):
-        # First call returns 500, second returns success
+    @pytest.mark.parametrize(
+        "method, body, expected",
+        [
+            ("get", None, {"result": "ok"}),
+            ("post", {"name": "test"}, {"id": "123"}),
+        ],
+    )
+    def test_request_success(self, httpx_mock, http_client, method, body, expected):
         httpx_mock.add_response(
             url="https://test.example.com/v1/test",
-            status_code=500,
-            json={"error": {"message": "Server error"}},
-        )
+            json=expected,
+        )
+        kwargs = {"json": body} if body is not None else {}
+        result = getattr(http_client, method)("/test", **kwargs)
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "status, exc",
+        [
+            (401, AuthenticationError),
+            (404, NotFoundError),
+            (422, ValidationError),
+        ],
+    )
+    def test_error_status_raises(self, httpx_mock, http_client, status, exc):
         httpx_mock.add_response(
             url="https://test.example.com/v1/test",
-            json={"result": "ok"},
-        )
+            status_code=status,
+            json={"error": {"message": "test error"}},
+        )
+        with pytest.raises(exc):
+            http_client.get("/test")
+
+    @pytest.mark.httpx_mock(should_mock=lambda request: False)
+    def test_retry_on_500(self, httpserver):
+        # Real in-process server: first call returns 500, second succeeds, so
+        # the retry exercises the actual httpx connection pool. Retry-After: 0
+        # keeps the backoff from sleeping real wall time.
+        httpserver.expect_ordered_request("/test").respond_with_json(
+            {"error": {"message": "Server error"}},
+            status=500,
+            headers={"Retry-After": "0"},
+        )
+        httpserver.expect_ordered_request("/test").respond_with_json({"result": "ok"})
         client = HttpClient(
             api_key="test_key",
-            base_url="https://test.example.com/v1",
+            base_url=httpserver.url_for(""),
             max_retries=1,
         )
         result = client.get("/test")
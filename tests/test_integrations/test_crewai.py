@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import pytest
-from unittest.mock import MagicMock
 
 import protol.integrations.crewai as _crew_mod
 from protol.client import Protol
 
+# Allow wrapper instantiation even without crewai installed. Patched once at
+# import instead of per-test monkeypatch bookkeeping; no test needs the real
+# Crew class.
+if _crew_mod.Crew is None:
+    _crew_mod.Crew = object
+
 
 class MockCrew:
     """Mock CrewAI Crew for testing."""
@@ -24,13 +29,9 @@ class MockFailingCrew:
 
 
 class TestCrewAIWrapper:
-    @pytest.fixture(autouse=True)
-    def _patch_crew(self, monkeypatch):
-        """Allow instantiation even without crewai installed."""
-        monkeypatch.setattr(_crew_mod, "Crew", object)
-
-    @pytest.fixture
-    def setup(self):
+    @pytest.fixture(scope="module")
+    def crew_agents(self):
+        """One client and two registered agents shared across the module."""
         aos = Protol(api_key="test", local_mode=True)
         researcher = aos.register_agent(
             name="crew-researcher",
@@ -45,6 +46,22 @@ class TestCrewAIWrapper:
         yield aos, researcher, writer
         aos.close()
 
+    @pytest.fixture
+    def setup(self, crew_agents):
+        """Per-test view of the shared agents with action-log isolation."""
+        aos, researcher, writer = crew_agents
+        store = aos._client
+        snapshots = {
+            agent.id: list(store._actions.get(agent.id, []))
+            for agent in (researcher, writer)
+        }
+        yield aos, researcher, writer
+        for agent_id, actions in snapshots.items():
+            store._actions[agent_id][:] = actions
+            # Stats and reputation were recomputed during the test; bring
+            # them back in line with the restored action logs.
+            store._recompute_reputation(agent_id)
+
     def test_kickoff_logs_actions(self, setup):
         aos, researcher, writer = setup
         from protol.integrations.crewai import CrewAIWrapper
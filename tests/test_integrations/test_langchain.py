@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import pytest
-from unittest.mock import MagicMock, AsyncMock
 
 import protol.integrations.langchain as _lc_mod
 from protol.client import Protol
+from protol.integrations.langchain import LangChainWrapper
+from tests.conftest import assert_stream_equals
+
+# Allow wrapper instantiation even without langchain-core installed. Patched
+# once at import instead of per-test monkeypatch bookkeeping; no test needs
+# the real Runnable class.
+if _lc_mod.Runnable is None:
+    _lc_mod.Runnable = object
 
 
 class MockRunnable:
@@ -36,14 +43,15 @@ class MockFailingRunnable:
         raise RuntimeError("LangChain async invoke failed")
 
 
-class TestLangChainWrapper:
-    @pytest.fixture(autouse=True)
-    def _patch_runnable(self, monkeypatch):
-        """Allow instantiation even without langchain-core installed."""
-        monkeypatch.setattr(_lc_mod, "Runnable", object)
+# The mocks carry no per-test state, so share one instance of each.
+_RUNNABLE = MockRunnable()
+_FAILING = MockFailingRunnable()
 
-    @pytest.fixture
-    def aos_and_agent(self):
+
+class TestLangChainWrapper:
+    @pytest.fixture(scope="module")
+    def _aos_and_agent_module(self):
+        """One client and registered agent shared across the module."""
         aos = Protol(api_key="test", local_mode=True)
         agent = aos.register_agent(
             name="lc-test-agent",
@@ -53,13 +61,19 @@ class TestLangChainWrapper:
         yield aos, agent
         aos.close()
 
+    @pytest.fixture
+    def aos_and_agent(self, _aos_and_agent_module):
+        """Per-test view of the shared agent with an empty action log."""
+        aos, agent = _aos_and_agent_module
+        aos._client._actions[agent.id].clear()
+        # Reset the stats/reputation derived from previous tests' actions too.
+        aos._client._recompute_reputation(agent.id)
+        return aos, agent
+
     def test_invoke_logs_success(self, aos_and_agent):
         aos, agent = aos_and_agent
-        # Import directly to avoid langchain_core dependency
-        from protol.integrations.langchain import LangChainWrapper
-
         wrapper = LangChainWrapper(
-            runnable=MockRunnable(),
+            runnable=_RUNNABLE,
             agent=agent,
             task_category="research",
         )
@@ -74,10 +88,8 @@ class TestLangChainWrapper:
 
     def test_invoke_logs_failure(self, aos_and_agent):
         aos, agent = aos_and_agent
-        from protol.integrations.langchain import LangChainWrapper
-
         wrapper = LangChainWrapper(
-            runnable=MockFailingRunnable(),
+            runnable=_FAILING,
             agent=agent,
             task_category="research",
         )
@@ -91,10 +103,8 @@ class TestLangChainWrapper:
 
     def test_batch_logs_each(self, aos_and_agent):
         aos, agent = aos_and_agent
-        from protol.integrations.langchain import LangChainWrapper
-
         wrapper = LangChainWrapper(
-            runnable=MockRunnable(),
+            runnable=_RUNNABLE,
             agent=agent,
             task_category="writing",
         )
@@ -107,16 +117,13 @@ class TestLangChainWrapper:
 
     def test_stream_logs_after_completion(self, aos_and_agent):
         aos, agent = aos_and_agent
-        from protol.integrations.langchain import LangChainWrapper
-
         wrapper = LangChainWrapper(
-            runnable=MockRunnable(),
+            runnable=_RUNNABLE,
             agent=agent,
             task_category="research",
         )
 
-        chunks = list(wrapper.stream("test input"))
-        assert chunks == ["Hello", " ", "World"]
+        assert_stream_equals(wrapper.stream("test input"), ("Hello", " ", "World"))
 
         actions = agent.get_actions()
         assert len(actions) == 1
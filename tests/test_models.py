@@ -5,27 +5,31 @@ from __future__ import annotations
 import pytest
 from datetime import datetime, timezone
 
-from protol.models import (
-    ActionRating,
-    ActionRecord,
-    ActionResponse,
-    AgentProfile,
-    AgentRegistration,
-    AgentUpdate,
-    EcosystemStats,
-    IncidentReport,
-    IncidentResponse,
-    LeaderboardEntry,
-    ReputationBreakdown,
-    ReputationHistory,
-    SearchResult,
-)
+from protol import models
 from tests.conftest import make_agent_profile_dict, make_action_response_dict
 
+# Shared across the module: one frozen timestamp and one set of known-good
+# kwargs, so the negative tests only spell out the field under test. The
+# fixed date avoids clock syscalls and any midnight-rollover flakiness.
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+_BASE_REG_KWARGS = {
+    "name": "test-agent",
+    "category": "research",
+    "capabilities": ["test"],
+}
+
+_BASE_RECORD_KWARGS = {
+    "agent_id": "agt_abc123def",
+    "action_type": "task_execution",
+    "status": "success",
+    "started_at": _FIXED_NOW,
+}
+
 
 class TestAgentRegistration:
     def test_valid_registration(self):
-        reg = AgentRegistration(
+        reg = models.AgentRegistration(
             name="my-research-agent",
             category="research",
             capabilities=["web_research", "summarization"],
@@ -35,83 +39,43 @@ class TestAgentRegistration:
         assert reg.autonomy_level == "semi"
 
     def test_invalid_category(self):
-        with pytest.raises(ValueError, match="Invalid category"):
-            AgentRegistration(
-                name="test-agent",
-                category="invalid_category",
-                capabilities=["test"],
-            )
+        with pytest.raises(ValueError, match="category"):
+            models.AgentRegistration(**{**_BASE_REG_KWARGS, "category": "invalid_category"})
 
     def test_invalid_name_too_short(self):
         with pytest.raises(ValueError):
-            AgentRegistration(
-                name="ab",
-                category="research",
-                capabilities=["test"],
-            )
+            models.AgentRegistration(**{**_BASE_REG_KWARGS, "name": "ab"})
 
     def test_invalid_name_special_chars(self):
         with pytest.raises(ValueError, match="alphanumeric"):
-            AgentRegistration(
-                name="@invalid!",
-                category="research",
-                capabilities=["test"],
-            )
+            models.AgentRegistration(**{**_BASE_REG_KWARGS, "name": "@invalid!"})
 
     def test_empty_capabilities(self):
         with pytest.raises(ValueError):
-            AgentRegistration(
-                name="test-agent",
-                category="research",
-                capabilities=[],
-            )
+            models.AgentRegistration(**{**_BASE_REG_KWARGS, "capabilities": []})
 
     def test_capability_too_short(self):
         with pytest.raises(ValueError, match="2-50 characters"):
-            AgentRegistration(
-                name="test-agent",
-                category="research",
-                capabilities=["x"],
-            )
+            models.AgentRegistration(**{**_BASE_REG_KWARGS, "capabilities": ["x"]})
 
     def test_invalid_autonomy_level(self):
-        with pytest.raises(ValueError, match="Invalid autonomy_level"):
-            AgentRegistration(
-                name="test-agent",
-                category="research",
-                capabilities=["test"],
-                autonomy_level="full",
-            )
+        with pytest.raises(ValueError, match="autonomy_level"):
+            models.AgentRegistration(**_BASE_REG_KWARGS, autonomy_level="full")
 
     def test_invalid_source_url(self):
         with pytest.raises(ValueError, match="HTTP/HTTPS"):
-            AgentRegistration(
-                name="test-agent",
-                category="research",
-                capabilities=["test"],
-                source_url="ftp://invalid.com",
-            )
+            models.AgentRegistration(**_BASE_REG_KWARGS, source_url="ftp://invalid.com")
 
     def test_valid_source_url(self):
-        reg = AgentRegistration(
-            name="test-agent",
-            category="research",
-            capabilities=["test"],
-            source_url="https://github.com/test",
-        )
+        reg = models.AgentRegistration(**_BASE_REG_KWARGS, source_url="https://github.com/test")
         assert reg.source_url == "https://github.com/test"
 
     def test_description_max_length(self):
         with pytest.raises(ValueError):
-            AgentRegistration(
-                name="test-agent",
-                category="research",
-                capabilities=["test"],
-                description="x" * 501,
-            )
+            models.AgentRegistration(**_BASE_REG_KWARGS, description="x" * 501)
 
     def test_all_fields(self):
-        reg = AgentRegistration(
+        reg = models.AgentRegistration(
             name="full-agent",
             category="coding",
             capabilities=["python", "javascript"],
@@ -132,108 +96,71 @@ class TestAgentRegistration:
 
 class TestAgentUpdate:
     def test_all_optional(self):
-        update = AgentUpdate()
+        update = models.AgentUpdate()
         assert update.name is None
         assert update.category is None
 
     def test_partial_update(self):
-        update = AgentUpdate(name="new-name", category="coding")
+        update = models.AgentUpdate(name="new-name", category="coding")
         assert update.name == "new-name"
         assert update.capabilities is None
 
     def test_invalid_category(self):
         with pytest.raises(ValueError):
-            AgentUpdate(category="bad_category")
+            models.AgentUpdate(category="bad_category")
 
 
 class TestActionRecord:
     def test_valid_record(self):
-        now = datetime.now(timezone.utc)
-        record = ActionRecord(
-            agent_id="agt_abc123def",
-            action_type="task_execution",
-            status="success",
-            started_at=now,
-        )
+        record = models.ActionRecord(**_BASE_RECORD_KWARGS)
         assert record.status == "success"
         assert record.environment == "production"
 
     def test_invalid_action_type(self):
-        with pytest.raises(ValueError, match="Invalid action_type"):
-            ActionRecord(
-                agent_id="agt_abc123def",
-                action_type="invalid_type",
-                status="success",
-                started_at=datetime.now(timezone.utc),
-            )
+        with pytest.raises(ValueError, match="action_type"):
+            models.ActionRecord(**{**_BASE_RECORD_KWARGS, "action_type": "invalid_type"})
 
     def test_invalid_status(self):
-        with pytest.raises(ValueError, match="Invalid status"):
-            ActionRecord(
-                agent_id="agt_abc123def",
-                action_type="task_execution",
-                status="invalid_status",
-                started_at=datetime.now(timezone.utc),
-            )
+        with pytest.raises(ValueError, match="status"):
+            models.ActionRecord(**{**_BASE_RECORD_KWARGS, "status": "invalid_status"})
 
     def test_confidence_range(self):
         with pytest.raises(ValueError):
-            ActionRecord(
-                agent_id="agt_abc123def",
-                action_type="task_execution",
-                status="success",
-                started_at=datetime.now(timezone.utc),
-                self_reported_confidence=1.5,
-            )
+            models.ActionRecord(**_BASE_RECORD_KWARGS, self_reported_confidence=1.5)
 
     def test_invalid_commissioner_type(self):
         with pytest.raises(ValueError, match="agent.*human"):
-            ActionRecord(
-                agent_id="agt_abc123def",
-                action_type="task_execution",
-                status="success",
-                started_at=datetime.now(timezone.utc),
-                commissioner_type="bot",
-            )
+            models.ActionRecord(**_BASE_RECORD_KWARGS, commissioner_type="bot")
 
     def test_invalid_error_type(self):
-        with pytest.raises(ValueError, match="Invalid error_type"):
-            ActionRecord(
-                agent_id="agt_abc123def",
-                action_type="task_execution",
-                status="failed",
-                started_at=datetime.now(timezone.utc),
+        with pytest.raises(ValueError, match="error_type"):
+            models.ActionRecord(
+                **{**_BASE_RECORD_KWARGS, "status": "failed"},
                 error_type="invalid",
             )
 
     def test_invalid_environment(self):
-        with pytest.raises(ValueError, match="Invalid environment"):
-            ActionRecord(
-                agent_id="agt_abc123def",
-                action_type="task_execution",
-                status="success",
-                started_at=datetime.now(timezone.utc),
-                environment="dev",
-            )
+        with pytest.raises(ValueError, match="environment"):
+            models.ActionRecord(**_BASE_RECORD_KWARGS, environment="dev")
 
 
 class TestActionRating:
     def test_valid_rating(self):
-        rating = ActionRating(rating=5, feedback="Excellent work")
+        rating = models.ActionRating(rating=5, feedback="Excellent work")
         assert rating.rating == 5
 
     def test_rating_too_low(self):
         with pytest.raises(ValueError):
-            ActionRating(rating=0)
+            models.ActionRating(rating=0)
 
     def test_rating_too_high(self):
         with pytest.raises(ValueError):
-            ActionRating(rating=6)
+            models.ActionRating(rating=6)
 
 
 class TestIncidentReport:
     def test_valid_incident(self):
-        report = IncidentReport(
+        report = models.IncidentReport(
             agent_id="agt_abc123def",
             incident_type="hallucination",
             severity="medium",
@@ -243,8 +170,8 @@ class TestIncidentReport:
         assert report.severity == "medium"
 
     def test_invalid_incident_type(self):
-        with pytest.raises(ValueError, match="Invalid incident_type"):
-            IncidentReport(
+        with pytest.raises(ValueError, match="incident_type"):
+            models.IncidentReport(
                 agent_id="agt_abc123def",
                 incident_type="invalid_type",
                 severity="low",
@@ -254,7 +181,7 @@ class TestIncidentReport:
 
     def test_title_too_short(self):
         with pytest.raises(ValueError):
-            IncidentReport(
+            models.IncidentReport(
                 agent_id="agt_abc123def",
                 incident_type="hallucination",
                 severity="low",
@@ -264,24 +191,30 @@ class TestIncidentReport:
 
 
 class TestResponseModels:
-    def test_agent_profile_roundtrip(self):
-        data = make_agent_profile_dict()
-        profile = AgentProfile.model_validate(data)
-        assert profile.agent_id == "agt_test1234"
-        assert profile.reputation.overall_score == 82.5
-        assert profile.reputation.breakdown.reliability == 85.0
-        dumped = profile.model_dump(mode="json")
-        reparsed = AgentProfile.model_validate(dumped)
-        assert reparsed.agent_id == profile.agent_id
-
-    def test_action_response_roundtrip(self):
-        data = make_action_response_dict()
-        response = ActionResponse.model_validate(data)
-        assert response.action_id == "act_test1234"
-        assert response.status == "success"
-        dumped = response.model_dump(mode="json")
-        reparsed = ActionResponse.model_validate(dumped)
-        assert reparsed.action_id == response.action_id
+    @pytest.fixture(scope="module")
+    def parsed_profile(self):
+        """models.AgentProfile validated once for the module."""
+        return models.AgentProfile.model_validate(make_agent_profile_dict())
+
+    @pytest.fixture(scope="module")
+    def parsed_response(self):
+        """models.ActionResponse validated once for the module."""
+        return models.ActionResponse.model_validate(make_action_response_dict())
+
+    def test_agent_profile_roundtrip(self, parsed_profile):
+        assert parsed_profile.agent_id == "agt_test1234"
+        assert parsed_profile.reputation.overall_score == 82.5
+        assert parsed_profile.reputation.breakdown.reliability == 85.0
+        dumped = parsed_profile.model_dump(mode="json")
+        reparsed = models.AgentProfile.model_validate(dumped)
+        assert reparsed.agent_id == parsed_profile.agent_id
+
+    def test_action_response_roundtrip(self, parsed_response):
+        assert parsed_response.action_id == "act_test1234"
+        assert parsed_response.status == "success"
+        dumped = parsed_response.model_dump(mode="json")
+        reparsed = models.ActionResponse.model_validate(dumped)
+        assert reparsed.action_id == parsed_response.action_id
 
     def test_search_result(self):
         data = {
@@ -291,7 +224,7 @@ class TestResponseModels:
             "per_page": 20,
             "has_more": False,
         }
-        result = SearchResult.model_validate(data)
+        result = models.SearchResult.model_validate(data)
         assert result.total == 1
         assert len(result.agents) == 1
 
@@ -306,7 +239,7 @@ class TestResponseModels:
             "actions_last_24h": 200,
             "actions_last_7d": 1200,
         }
-        stats = EcosystemStats.model_validate(data)
+        stats = models.EcosystemStats.model_validate(data)
         assert stats.total_agents == 100
         assert stats.agents_by_category["research"] == 30
 
@@ -318,12 +251,12 @@ class TestResponseModels:
             "efficiency": 80.0,
             "transparency": 70.0,
         }
-        breakdown = ReputationBreakdown.model_validate(data)
+        breakdown = models.ReputationBreakdown.model_validate(data)
         assert breakdown.reliability == 90.0
 
     def test_optional_fields_default(self):
         data = make_agent_profile_dict(description=None, tags=None, source_url=None)
-        profile = AgentProfile.model_validate(data)
+        profile = models.AgentProfile.model_validate(data)
         assert profile.description is None
         assert profile.tags is None
         assert profile.source_url is None
@@ -13,35 +13,29 @@ from protol._utils import (
 )
 
 
-class TestHashData:
-    def test_hash_string(self):
-        h = hash_data("hello world")
-        assert isinstance(h, str)
-        assert len(h) == 64  # SHA-256 hex digest
-
-    def test_hash_bytes(self):
-        h = hash_data(b"hello world")
-        assert isinstance(h, str)
-        assert len(h) == 64
-
-    def test_hash_dict(self):
-        h = hash_data({"key": "value", "number": 42})
-        assert isinstance(h, str)
-        assert len(h) == 64
+# Key-order variants for the determinism check, built once at import.
+_HASH_PAIR = ({"a": 1, "b": 2}, {"b": 2, "a": 1})
 
-    def test_hash_list(self):
-        h = hash_data([1, 2, 3])
-        assert isinstance(h, str)
-        assert len(h) == 64
 
-    def test_hash_none(self):
-        h = hash_data(None)
+class TestHashData:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "hello world",
+            b"hello world",
+            {"key": "value", "number": 42},
+            [1, 2, 3],
+            None,
+        ],
+        ids=["str", "bytes", "dict", "list", "none"],
+    )
+    def test_hash_returns_sha256_hex(self, data):
+        h = hash_data(data)
         assert isinstance(h, str)
-        assert len(h) == 64
+        assert len(h) == 64  # SHA-256 hex digest
 
     def test_hash_deterministic(self):
-        h1 = hash_data({"a": 1, "b": 2})
-        h2 = hash_data({"b": 2, "a": 1})
+        h1, h2 = (hash_data(d) for d in _HASH_PAIR)
         assert h1 == h2  # Canonical JSON (sorted keys)
 
     def test_hash_different_data_differs(self):
@@ -58,38 +52,36 @@ class TestHashData:
         assert len(h) == 64
 
 
-class TestValidateAgentId:
-    def test_valid_id(self):
-        assert validate_agent_id("agt_abc123") is True
-        assert validate_agent_id("agt_AbCdEf1234") is True
-        assert validate_agent_id("agt_123456") is True
-
-    def test_invalid_prefix(self):
-        assert validate_agent_id("agent_abc123") is False
-        assert validate_agent_id("abc123") is False
-
-    def test_too_short(self):
-        assert validate_agent_id("agt_abc") is False  # Only 3 chars after prefix
-
-    def test_too_long(self):
-        assert validate_agent_id("agt_abcdefghijklm") is False  # 13 chars after prefix
-
-    def test_invalid_chars(self):
-        assert validate_agent_id("agt_abc-123") is False
-        assert validate_agent_id("agt_abc_123") is False
-
-
-class TestValidateApiKey:
-    def test_valid_key(self):
-        assert validate_api_key("aos_sk_12345678901234567890") is True
-        assert validate_api_key("aos_sk_abcdefghijklmnopqrstuvwxyz") is True
-
-    def test_invalid_prefix(self):
-        assert validate_api_key("sk_12345678901234567890") is False
-        assert validate_api_key("aos_12345678901234567890") is False
-
-    def test_too_short(self):
-        assert validate_api_key("aos_sk_short") is False  # Less than 20 chars after prefix
+@pytest.mark.parametrize(
+    "candidate, expected",
+    [
+        ("agt_abc123", True),
+        ("agt_AbCdEf1234", True),
+        ("agt_123456", True),
+        ("agent_abc123", False),  # wrong prefix
+        ("abc123", False),
+        ("agt_abc", False),  # only 3 chars after prefix
+        ("agt_abcdefghijklm", False),  # 13 chars after prefix
+        ("agt_abc-123", False),  # invalid chars
+        ("agt_abc_123", False),
+    ],
+)
+def test_validate_agent_id(candidate, expected):
+    assert validate_agent_id(candidate) is expected
+
+
+@pytest.mark.parametrize(
+    "candidate, expected",
+    [
+        ("aos_sk_12345678901234567890", True),
+        ("aos_sk_abcdefghijklmnopqrstuvwxyz", True),
+        ("sk_12345678901234567890", False),  # wrong prefix
+        ("aos_12345678901234567890", False),
+        ("aos_sk_short", False),  # less than 20 chars after prefix
+    ],
+)
+def test_validate_api_key(candidate, expected):
+    assert validate_api_key(candidate) is expected
 
 
 class TestCalculateSizeBytes:
@@ -110,17 +102,17 @@ class TestCalculateSizeBytes:
         assert size == 0
 
 
-class TestTruncate:
-    def test_no_truncation(self):
-        assert truncate("hello", 10) == "hello"
-
-    def test_truncation(self):
-        result = truncate("hello world", 8)
-        assert result == "hello..."
-        assert len(result) == 8
-
-    def test_exact_length(self):
-        assert truncate("hello", 5) == "hello"
-
-    def test_very_short_max(self):
-        assert truncate("hello", 3) == "hel"
+@pytest.mark.parametrize(
+    "s, max_length, expected",
+    [
+        ("hello", 10, "hello"),  # no truncation
+        ("hello world", 8, "hello..."),
+        ("hello", 5, "hello"),  # exact length
+        ("hello", 4, "h..."),  # smallest max that fits the ellipsis
+        ("hello", 3, "hel"),  # too short for ellipsis
+    ],
+)
+def test_truncate(s, max_length, expected):
+    result = truncate(s, max_length)
+    assert result == expected
+    assert len(result) <= max_length